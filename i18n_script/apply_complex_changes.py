@@ -7,6 +7,12 @@ from dataclasses import dataclass
 import shutil
 from datetime import datetime
 
+# C loader from libyaml when available, pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 @dataclass
 class Config:
     project_path: str
@@ -54,7 +60,7 @@ class I18nApplicator:
         """Load configuration from YAML file"""
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             
             # Expand environment variables
             if 'openai_api_key' in config and config['openai_api_key'].startswith('${'):
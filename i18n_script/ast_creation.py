@@ -1,15 +1,94 @@
 import ast
+import bisect
+import contextlib
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+import mmap
 import re
 import os
 from typing import Dict, List, Tuple, Any, Optional
 import json
 
+# JavaScript keywords and built-in objects that are never project dependencies
+_JS_KEYWORDS = frozenset({
+    'const', 'let', 'var', 'function', 'class', 'if', 'else', 'for', 
+    'while', 'do', 'switch', 'case', 'break', 'continue', 'return',
+    'true', 'false', 'null', 'undefined', 'this', 'super', 'new',
+    'typeof', 'instanceof', 'in', 'of', 'delete', 'void', 'try',
+    'catch', 'finally', 'throw', 'async', 'await', 'import', 'export',
+    'default', 'from', 'as', 'extends', 'implements', 'interface',
+    'console', 'window', 'document', 'Array', 'Object', 'String',
+    'Number', 'Boolean', 'Date', 'Math', 'JSON', 'Promise', 'Error',
+    'React', 'useState', 'useEffect', 'useContext', 'useReducer',
+    'useMemo', 'useCallback', 'useRef', 'props', 'state', 'render'
+})
+
+@dataclasses.dataclass
+class Symbol:
+    """A symbol extracted from a React/JS file"""
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = ('description', 'type', 'span', 'return_output', 'dependencies', 'file', 'code')
+    description: str
+    type: str
+    span: Tuple[int, int]
+    return_output: str
+    dependencies: List[str]
+    file: str
+    code: str
+
 class ReactJSParser:
-    def __init__(self):
+    # Patterns are compiled once and shared by every parser instance.
+    # Files are scanned as raw bytes (see _read_source); matched names and code
+    # are decoded to str only when stored in the symbols dictionary.
+    # Line breaks as a text-mode read sees them: \r\n, \r or \n
+    _NEWLINE_RE = re.compile(rb'\r\n?|\n')
+
+    # Symbol name collection (first pass): function/class names, or const/let/var
+    # names (which also covers arrow functions) in a single scan
+    _SYMBOL_NAME_RE = re.compile(
+        rb'(?:function|class)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)'
+        rb'|(?:const|let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*='
+    )
+
+    # Symbol declarations (second pass)
+    _FUNC_RE = re.compile(rb'function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.MULTILINE | re.DOTALL)
+    _ARROW_RE = re.compile(rb'(?:const|let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.MULTILINE | re.DOTALL)
+    _CLASS_RE = re.compile(rb'class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?:extends\s+[a-zA-Z_$][a-zA-Z0-9_$]*)?\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.MULTILINE | re.DOTALL)
+    _CONST_RE = re.compile(rb'const\s+([A-Z_][A-Z0-9_]*)\s*=\s*([^;]+);?')
+    _VAR_RE = re.compile(rb'(?:let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*([^;]+);?')
+    _COMPONENT_RE = re.compile(rb'(?:const|let|var)\s+([A-Z][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.MULTILINE | re.DOTALL)
+
+    # Code inspection (on decoded code snippets)
+    _FUNC_CALL_RE = re.compile(r'([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\(')
+    _IDENT_RE = re.compile(r'(?<!\.)(?<![a-zA-Z0-9_$])([a-zA-Z_$][a-zA-Z0-9_$]*)(?![a-zA-Z0-9_$])')
+    _RETURN_RE = re.compile(r'return\s+([^;]+)')
+    _NUM_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+    # Files at least this large are memory-mapped instead of read into memory
+    _MMAP_MIN_SIZE = 64 * 1024
+
+    # Bump whenever extraction changes, so stale cache entries are ignored
+    _CACHE_VERSION = 3
+
+    def __init__(self, cache_path: Optional[str] = ".react_symbols_cache.json",
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            cache_path: JSON file memoizing per-file parse results between runs,
+                keyed by file modification time and size (None disables it)
+            max_workers: Number of processes used to parse changed files
+                (None uses all CPUs, 1 parses in this process)
+        """
         self.symbols = {}
         self.current_file = None
         self.file_content = None
+        self._file_symbols = {}  # Symbols extracted from current_file
+        self._newline_offsets = []  # Sorted offsets of the line breaks in file_content
         self.all_symbol_names = set()  # Track all defined symbols across all files
+        self._cache_path = cache_path
+        self._cache = self._load_cache()  # Parse results per file, also used within a run
+        self._cache_dirty = False
+        self._max_workers = max_workers
         
     def parse_files(self, react_files: List[str]) -> Dict[str, Any]:
         """
@@ -21,50 +100,133 @@ class ReactJSParser:
         Returns:
             Dictionary containing all extracted symbols
         """
-        # First pass: collect all symbol names
+        existing_files = []
         for file_path in react_files:
             if os.path.exists(file_path):
-                self._collect_symbol_names(file_path)
+                existing_files.append(file_path)
             else:
                 print(f"Warning: File {file_path} not found")
         
+        # Parse new and modified files up front, in parallel
+        self._parse_changed_files(existing_files)
+        
+        # First pass: collect all symbol names
+        for file_path in existing_files:
+            self._collect_symbol_names(file_path)
+        
         # Second pass: parse files and resolve dependencies
-        for file_path in react_files:
-            if os.path.exists(file_path):
-                self.parse_file(file_path)
-            else:
-                print(f"Warning: File {file_path} not found")
+        for file_path in existing_files:
+            self.parse_file(file_path)
         
         # Third pass: filter dependencies to only include known symbols
         self._filter_dependencies()
+        
+        self._prune_cache()
+        self._save_cache()
                 
-        return self.symbols
+        return {symbol_name: dataclasses.asdict(symbol) for symbol_name, symbol in self.symbols.items()}
+    
+    def _parse_changed_files(self, file_paths: List[str]):
+        """Parse files missing from the cache in worker processes and cache the results"""
+        changed_files = [file_path for file_path in file_paths if self._get_cached_entry(file_path) is None]
+        if len(changed_files) < 2 or self._max_workers == 1:
+            return  # Not worth starting workers; parse_file handles these inline
+        
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            entries = executor.map(_parse_file_entry, changed_files, chunksize=8)
+            for file_path, entry in zip(changed_files, entries):
+                # Failed files are left to parse_file, which reports the error
+                if entry is not None:
+                    self._cache[file_path] = entry
+                    self._cache_dirty = True
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the per-file parse cache, ignoring a missing or outdated one"""
+        if not self._cache_path or not os.path.exists(self._cache_path):
+            return {}
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') != self._CACHE_VERSION:
+                return {}
+            
+            files = {}
+            for file_path, entry in cache.get('files', {}).items():
+                symbols = {}
+                for symbol_name, symbol_info in entry['symbols'].items():
+                    symbol_info['span'] = tuple(symbol_info['span'])
+                    symbols[symbol_name] = Symbol(**symbol_info)
+                files[file_path] = {'stamp': list(entry['stamp']), 'names': list(entry['names']), 'symbols': symbols}
+            return files
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable symbols cache {self._cache_path}: {str(e)}")
+            return {}
+    
+    def _prune_cache(self):
+        """Drop cache entries for files that no longer exist"""
+        for file_path in [file_path for file_path in self._cache if not os.path.exists(file_path)]:
+            del self._cache[file_path]
+            self._cache_dirty = True
+    
+    def _save_cache(self):
+        """Persist the per-file parse cache if it changed"""
+        if not self._cache_path or not self._cache_dirty:
+            return
+        try:
+            files = {
+                file_path: dict(entry, symbols={symbol_name: dataclasses.asdict(symbol)
+                                                for symbol_name, symbol in entry['symbols'].items()})
+                for file_path, entry in self._cache.items()
+            }
+            with open(self._cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self._CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+            self._cache_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not write symbols cache {self._cache_path}: {str(e)}")
+    
+    def _get_file_stamp(self, file_path: str) -> List[int]:
+        """Get the (mtime, size) fingerprint used to validate cache entries"""
+        stat = os.stat(file_path)
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _get_cached_entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get the cache entry for a file if the file is unchanged since it was parsed"""
+        entry = self._cache.get(file_path)
+        if entry is not None and entry['stamp'] == self._get_file_stamp(file_path):
+            return entry
+        return None
+    
+    @contextlib.contextmanager
+    def _read_source(self, file_path: str):
+        """Yield the raw bytes of a file, memory-mapping large files"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self._MMAP_MIN_SIZE:
+                yield f.read()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield mapped
+    
+    def _decode(self, data: bytes) -> str:
+        """Decode matched source bytes, with newlines normalized as in a text-mode read"""
+        text = data.decode('utf-8', errors='replace')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _scan_symbol_names(self, content) -> set:
+        """Get function, class, constant, variable and arrow function names"""
+        return {match.group(match.lastindex).decode() for match in self._SYMBOL_NAME_RE.finditer(content)}
     
     def _collect_symbol_names(self, file_path: str):
         """First pass: collect all symbol names from a file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Collect function names
-            func_pattern = r'function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)'
-            self.all_symbol_names.update(re.findall(func_pattern, content))
-            
-            # Collect arrow function names
-            arrow_pattern = r'(?:const|let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>'
-            self.all_symbol_names.update(re.findall(arrow_pattern, content))
-            
-            # Collect class names
-            class_pattern = r'class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)'
-            self.all_symbol_names.update(re.findall(class_pattern, content))
-            
-            # Collect constant names
-            const_pattern = r'const\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*='
-            self.all_symbol_names.update(re.findall(const_pattern, content))
+            entry = self._get_cached_entry(file_path)
+            if entry is not None:
+                self.all_symbol_names.update(entry['names'])
+                return
             
-            # Collect variable names
-            var_pattern = r'(?:let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*='
-            self.all_symbol_names.update(re.findall(var_pattern, content))
+            with self._read_source(file_path) as content:
+                self.all_symbol_names.update(self._scan_symbol_names(content))
             
         except Exception as e:
             print(f"Error collecting symbols from {file_path}: {str(e)}")
@@ -73,51 +235,68 @@ class ReactJSParser:
         """Filter dependencies to only include known symbols"""
         for symbol_name, symbol_info in self.symbols.items():
             # Filter dependencies to only include symbols we've defined
-            filtered_deps = [dep for dep in symbol_info['dependencies'] 
-                           if dep in self.all_symbol_names and dep != symbol_name]
-            symbol_info['dependencies'] = list(set(filtered_deps))  # Remove duplicates
+            # (entries are already unique, see _extract_dependencies)
+            symbol_info.dependencies = [dep for dep in symbol_info.dependencies 
+                                        if dep in self.all_symbol_names and dep != symbol_name]
     
     def parse_file(self, file_path: str):
         """Parse a single React/JS file"""
         self.current_file = file_path
+        self._file_symbols = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.file_content = f.read()
-            
-            # Try to parse as JavaScript/React using regex patterns
-            # Since Python's AST is for Python, we'll use regex-based parsing
-            self._extract_functions()
-            self._extract_classes()
-            self._extract_constants()
-            self._extract_variables()
-            self._extract_arrow_functions()
-            self._extract_react_components()
+            entry = self._get_cached_entry(file_path)
+            if entry is None:
+                entry = self._extract_file_entry(file_path)
+                self._cache[file_path] = entry
+                self._cache_dirty = True
+            self._file_symbols = entry['symbols']
             
         except Exception as e:
             print(f"Error parsing {file_path}: {str(e)}")
-        """Parse a single React/JS file"""
+        finally:
+            self._merge_file_symbols()
+    
+    def _extract_file_entry(self, file_path: str) -> Dict[str, Any]:
+        """Extract a file's symbols and symbol names, in the form stored in the cache"""
         self.current_file = file_path
+        self._file_symbols = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.file_content = f.read()
-            
-            # Try to parse as JavaScript/React using regex patterns
-            # Since Python's AST is for Python, we'll use regex-based parsing
-            self._extract_functions()
-            self._extract_classes()
-            self._extract_constants()
-            self._extract_variables()
-            self._extract_arrow_functions()
-            self._extract_react_components()
-            
-        except Exception as e:
-            print(f"Error parsing {file_path}: {str(e)}")
+            stamp = self._get_file_stamp(file_path)
+            with self._read_source(file_path) as self.file_content:
+                # Offset of each break's last byte, i.e. where a text-mode read puts its '\n'
+                self._newline_offsets = [m.end() - 1 for m in self._NEWLINE_RE.finditer(self.file_content)]
+                
+                # Try to parse as JavaScript/React using regex patterns
+                # Since Python's AST is for Python, we'll use regex-based parsing
+                self._extract_functions()
+                self._extract_classes()
+                self._extract_constants()
+                self._extract_variables()
+                self._extract_arrow_functions()
+                
+                return {
+                    'stamp': stamp,
+                    'names': sorted(self._scan_symbol_names(self.file_content)),
+                    'symbols': self._file_symbols
+                }
+        finally:
+            self.file_content = None
+            self._newline_offsets = []
+    
+    def _merge_file_symbols(self):
+        """Merge the current file's symbols into the project-wide symbols"""
+        for symbol_name, symbol_info in self._file_symbols.items():
+            # Variables never replace a symbol captured from an earlier file
+            if symbol_info.type == 'variable' and symbol_name in self.symbols:
+                continue
+            # Copy, since _filter_dependencies rewrites entries in place
+            self.symbols[symbol_name] = dataclasses.replace(symbol_info)
     
     def _get_line_number(self, start_pos: int) -> int:
         """Get line number from character position"""
-        return self.file_content[:start_pos].count('\n') + 1
+        return bisect.bisect_left(self._newline_offsets, start_pos) + 1
     
     def _get_span(self, match) -> Tuple[int, int]:
         """Get span (start, end) from regex match"""
@@ -127,42 +306,25 @@ class ReactJSParser:
     
     def _extract_dependencies(self, code: str) -> List[str]:
         """Extract function calls and variable references from code"""
-        dependencies = []
-        
         # Function calls: functionName(...)
-        func_calls = re.findall(r'([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\(', code)
-        dependencies.extend(func_calls)
+        # (method calls like obj.method(...) are only caught by this pattern)
+        dependencies = set(self._FUNC_CALL_RE.findall(code))
         
         # Variable/constant references - look for standalone identifiers
         # This regex finds identifiers that are not part of object property access
-        var_refs = re.findall(r'(?<!\.)(?<![a-zA-Z0-9_$])([a-zA-Z_$][a-zA-Z0-9_$]*)(?![a-zA-Z0-9_$])', code)
-        dependencies.extend(var_refs)
-        
-        # Remove JavaScript keywords and built-in objects
-        js_keywords = {
-            'const', 'let', 'var', 'function', 'class', 'if', 'else', 'for', 
-            'while', 'do', 'switch', 'case', 'break', 'continue', 'return',
-            'true', 'false', 'null', 'undefined', 'this', 'super', 'new',
-            'typeof', 'instanceof', 'in', 'of', 'delete', 'void', 'try',
-            'catch', 'finally', 'throw', 'async', 'await', 'import', 'export',
-            'default', 'from', 'as', 'extends', 'implements', 'interface',
-            'console', 'window', 'document', 'Array', 'Object', 'String',
-            'Number', 'Boolean', 'Date', 'Math', 'JSON', 'Promise', 'Error',
-            'React', 'useState', 'useEffect', 'useContext', 'useReducer',
-            'useMemo', 'useCallback', 'useRef', 'props', 'state', 'render'
-        }
+        dependencies.update(self._IDENT_RE.findall(code))
         
         # Filter out keywords and return unique dependencies
-        filtered_deps = [dep for dep in dependencies if dep not in js_keywords]
-        return filtered_deps
+        dependencies -= _JS_KEYWORDS
+        return list(dependencies)
     
     def _extract_return_type(self, code: str) -> Optional[str]:
         """Try to infer return type from code"""
         # Look for return statements
-        return_matches = re.findall(r'return\s+([^;]+)', code)
+        return_matches = self._RETURN_RE.findall(code)
         if return_matches:
             return_val = return_matches[-1].strip()
-            if return_val.startswith('"') or return_val.startswith("'"):
+            if return_val[:1] in ('"', "'"):
                 return "string"
             elif return_val.startswith('['):
                 return "array"
@@ -170,132 +332,130 @@ class ReactJSParser:
                 return "object"
             elif return_val in ['true', 'false']:
                 return "boolean"
-            elif return_val.isdigit():
+            elif self._NUM_RE.fullmatch(return_val):
                 return "number"
         return "unknown"
     
     def _extract_functions(self):
         """Extract regular function declarations"""
-        pattern = r'function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        matches = re.finditer(pattern, self.file_content, re.MULTILINE | re.DOTALL)
+        matches = self._FUNC_RE.finditer(self.file_content)
         
         for match in matches:
-            func_name = match.group(1)
-            full_code = match.group(0)
+            func_name = match.group(1).decode()
+            full_code = self._decode(match.group(0))
             
-            self.symbols[func_name] = {
-                "description": f"Function {func_name}",
-                "type": "function",
-                "span": self._get_span(match),
-                "return_output": self._extract_return_type(full_code),
-                "dependencies": self._extract_dependencies(full_code),
-                "file": self.current_file,
-                "code": full_code.strip()
-            }
+            self._file_symbols[func_name] = Symbol(
+                description=f"Function {func_name}",
+                type="function",
+                span=self._get_span(match),
+                return_output=self._extract_return_type(full_code),
+                dependencies=self._extract_dependencies(full_code),
+                file=self.current_file,
+                code=full_code.strip()
+            )
     
     def _extract_arrow_functions(self):
-        """Extract arrow function declarations"""
-        # const/let/var funcName = (...) => { ... }
-        pattern = r'(?:const|let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        matches = re.finditer(pattern, self.file_content, re.MULTILINE | re.DOTALL)
+        """Extract arrow function declarations, including React components"""
+        matches = self._ARROW_RE.finditer(self.file_content)
         
         for match in matches:
-            func_name = match.group(1)
-            full_code = match.group(0)
+            func_name = match.group(1).decode()
+            full_code = self._decode(match.group(0))
             
-            self.symbols[func_name] = {
-                "description": f"Arrow function {func_name}",
-                "type": "arrow_function",
-                "span": self._get_span(match),
-                "return_output": self._extract_return_type(full_code),
-                "dependencies": self._extract_dependencies(full_code),
-                "file": self.current_file,
-                "code": full_code.strip()
-            }
+            # Capitalized arrow functions are React components
+            if func_name[0].isupper():
+                self._add_react_component(match)
+                continue
+            
+            self._file_symbols[func_name] = Symbol(
+                description=f"Arrow function {func_name}",
+                type="arrow_function",
+                span=self._get_span(match),
+                return_output=self._extract_return_type(full_code),
+                dependencies=self._extract_dependencies(full_code),
+                file=self.current_file,
+                code=full_code.strip()
+            )
+            
+            # Components defined inside this function body (e.g. HOC wrappers)
+            for inner_match in self._COMPONENT_RE.finditer(self.file_content, match.end(1), match.end()):
+                self._add_react_component(inner_match)
     
     def _extract_classes(self):
         """Extract class declarations"""
-        pattern = r'class\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?:extends\s+[a-zA-Z_$][a-zA-Z0-9_$]*)?\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        matches = re.finditer(pattern, self.file_content, re.MULTILINE | re.DOTALL)
+        matches = self._CLASS_RE.finditer(self.file_content)
         
         for match in matches:
-            class_name = match.group(1)
-            full_code = match.group(0)
+            class_name = match.group(1).decode()
+            full_code = self._decode(match.group(0))
             
-            self.symbols[class_name] = {
-                "description": f"Class {class_name}",
-                "type": "class",
-                "span": self._get_span(match),
-                "return_output": "class_instance",
-                "dependencies": self._extract_dependencies(full_code),
-                "file": self.current_file,
-                "code": full_code.strip()
-            }
+            self._file_symbols[class_name] = Symbol(
+                description=f"Class {class_name}",
+                type="class",
+                span=self._get_span(match),
+                return_output="class_instance",
+                dependencies=self._extract_dependencies(full_code),
+                file=self.current_file,
+                code=full_code.strip()
+            )
     
     def _extract_constants(self):
         """Extract constant declarations"""
-        pattern = r'const\s+([A-Z_][A-Z0-9_]*)\s*=\s*([^;]+);?'
-        matches = re.finditer(pattern, self.file_content)
+        matches = self._CONST_RE.finditer(self.file_content)
         
         for match in matches:
-            const_name = match.group(1)
-            const_value = match.group(2).strip()
+            const_name = match.group(1).decode()
+            const_value = self._decode(match.group(2)).strip()
             
-            self.symbols[const_name] = {
-                "description": f"Constant {const_name}",
-                "type": "constant",
-                "span": self._get_span(match),
-                "return_output": self._infer_type(const_value),
-                "dependencies": self._extract_dependencies(const_value),
-                "file": self.current_file,
-                "code": match.group(0).strip()
-            }
+            self._file_symbols[const_name] = Symbol(
+                description=f"Constant {const_name}",
+                type="constant",
+                span=self._get_span(match),
+                return_output=self._infer_type(const_value),
+                dependencies=self._extract_dependencies(const_value),
+                file=self.current_file,
+                code=self._decode(match.group(0)).strip()
+            )
     
     def _extract_variables(self):
         """Extract variable declarations"""
-        pattern = r'(?:let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*([^;]+);?'
-        matches = re.finditer(pattern, self.file_content)
+        matches = self._VAR_RE.finditer(self.file_content)
         
         for match in matches:
-            var_name = match.group(1)
-            var_value = match.group(2).strip()
+            var_name = match.group(1).decode()
+            var_value = self._decode(match.group(2)).strip()
             
             # Skip if it's already captured as a function
-            if var_name not in self.symbols:
-                self.symbols[var_name] = {
-                    "description": f"Variable {var_name}",
-                    "type": "variable",
-                    "span": self._get_span(match),
-                    "return_output": self._infer_type(var_value),
-                    "dependencies": self._extract_dependencies(var_value),
-                    "file": str(self.current_file),
-                    "code": match.group(0).strip()
-                }
+            if var_name not in self._file_symbols:
+                self._file_symbols[var_name] = Symbol(
+                    description=f"Variable {var_name}",
+                    type="variable",
+                    span=self._get_span(match),
+                    return_output=self._infer_type(var_value),
+                    dependencies=self._extract_dependencies(var_value),
+                    file=str(self.current_file),
+                    code=self._decode(match.group(0)).strip()
+                )
     
-    def _extract_react_components(self):
-        """Extract React component declarations"""
-        # React functional components
-        pattern = r'(?:const|let|var)\s+([A-Z][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        matches = re.finditer(pattern, self.file_content, re.MULTILINE | re.DOTALL)
+    def _add_react_component(self, match):
+        """Record a React component declaration matched by _ARROW_RE/_COMPONENT_RE"""
+        component_name = match.group(1).decode()
+        full_code = self._decode(match.group(0))
         
-        for match in matches:
-            component_name = match.group(1)
-            full_code = match.group(0)
-            
-            self.symbols[component_name] = {
-                "description": f"React component {component_name}",
-                "type": "react_component",
-                "span": self._get_span(match),
-                "return_output": "jsx_element",
-                "dependencies": self._extract_dependencies(full_code),
-                "file": self.current_file,
-                "code": full_code.strip()
-            }
+        self._file_symbols[component_name] = Symbol(
+            description=f"React component {component_name}",
+            type="react_component",
+            span=self._get_span(match),
+            return_output="jsx_element",
+            dependencies=self._extract_dependencies(full_code),
+            file=self.current_file,
+            code=full_code.strip()
+        )
     
     def _infer_type(self, value: str) -> str:
         """Infer the type of a value"""
         value = value.strip()
-        if value.startswith('"') or value.startswith("'") or value.startswith('`'):
+        if value[:1] in ('"', "'", '`'):
             return "string"
         elif value.startswith('['):
             return "array"
@@ -303,21 +463,29 @@ class ReactJSParser:
             return "object"
         elif value in ['true', 'false']:
             return "boolean"
-        elif value.replace('.', '').isdigit():
+        elif self._NUM_RE.fullmatch(value):
             return "number"
         else:
             return "unknown"
 
+def _parse_file_entry(file_path: str) -> Optional[Dict[str, Any]]:
+    """Worker process entry point: parse one file, or return None if it fails"""
+    try:
+        return ReactJSParser(cache_path=None)._extract_file_entry(file_path)
+    except Exception:
+        return None
+
 # Usage example
-def parse_react_project(files: List[str]) -> Dict[str, Any]:
+def parse_react_project(files: List[str], cache_path: Optional[str] = ".react_symbols_cache.json") -> Dict[str, Any]:
     """
     Main function to parse React project files
     
     Args:
         react_files: List of React/JS file paths
+        cache_path: Per-file parse cache (None or empty disables it)
         
     Returns:
         Dictionary with extracted symbols
     """
-    parser = ReactJSParser()
+    parser = ReactJSParser(cache_path=cache_path)
     return parser.parse_files([str(i) for i in files])
\ No newline at end of file
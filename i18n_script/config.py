@@ -1,9 +1,16 @@
+import functools
 import os
 from dataclasses import dataclass
 from typing import List
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
 
@@ -15,15 +22,25 @@ class Config:
     symbols_dict_path: str
     target_languages: List[str] = None
     default_language: str = "en"
+    # JSON file caching parsed symbols per source file (empty disables it)
+    symbols_cache_path: str = ".react_symbols_cache.json"
+    # SQLite file caching LLM translations between runs (empty disables it)
+    translation_cache_path: str = ".translation_cache.sqlite"
 
     def __post_init__(self):
         if self.target_languages is None:
             self.target_languages = ["en", "es"]
 
 
-def load_config(path: str = "config.yaml") -> Config:
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key so edits to the file are picked up
     with open(path, "r") as f:
-        raw_cfg = yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_config(path: str = "config.yaml") -> Config:
+    raw_cfg = _read_config_file(path, os.stat(path).st_mtime_ns)
 
     # Resolve environment variable if used in YAML
     api_key = raw_cfg["openai_api_key"]
@@ -31,10 +48,17 @@ def load_config(path: str = "config.yaml") -> Config:
         env_var = api_key[2:-1]
         api_key = os.getenv(env_var, "")
 
+    # Copy the cached list; leave None (an empty key) for Config to default
+    target_languages = raw_cfg.get("target_languages")
+    if isinstance(target_languages, list):
+        target_languages = list(target_languages)
+
     return Config(
         project_path=raw_cfg["project_path"],
         openai_api_key=api_key,
         symbols_dict_path=raw_cfg["symbols_dict_path"],
-        target_languages=raw_cfg.get("target_languages", ["en", "es"]),
+        target_languages=target_languages,
         default_language=raw_cfg.get("default_language", "en"),
+        symbols_cache_path=raw_cfg.get("symbols_cache_path", ".react_symbols_cache.json"),
+        translation_cache_path=raw_cfg.get("translation_cache_path", ".translation_cache.sqlite"),
     )
@@ -4,22 +4,234 @@ i18n Agent for React App
 Automatically adds internationalization to a React application
 """
 
+import asyncio
+import functools
 import os
 import re
 import json
 import hashlib
+import mmap
+import sqlite3
 from pathlib import Path, PosixPath
 from typing import Dict, List, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
-from openai import OpenAI
+from concurrent.futures import ProcessPoolExecutor
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 from collections import OrderedDict
 from config import Config, load_config
 from ast_creation import parse_react_project
 from complex_i18n import ComplexI18nProcessor
 
+# Much faster JSON encoder when available, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns to find hardcoded strings, combined so a file is scanned once.
+# The alternation sits in a lookahead so every start position is tried for
+# each kind, even inside a match of another kind; the alternatives start
+# with different characters, so at most one matches at a given position.
+_STRING_RE = re.compile(
+    # r'<(?:button|a|span|p|h[1-6]|div)[^>]*>\s*([^<>]+?)\s*</(?:button|a|span|p|h[1-6]|div)>',
+    r'(?='
+
+    # JSX any element with direct innerText (fallback for generic cases)
+    r'(?P<jsx>>(?P<jsx_text>[^<\n][^<]+?)</)'
+
+    # String literals in props like title="Save", label="Name"
+    r'|(?P<attr>(?:title|label|placeholder|alt|value|message|description|error|success|warning|info)\s*=\s*["\'](?P<attr_text>[^"\']+?)["\'])'
+
+    # Error messages, notifications (console, alert, notify, etc.)
+    r'|(?P<call>(?:alert|notify|console\.(?:log|error|warn))\s*\(\s*["\'](?P<call_text>[^"\']+?)["\']\s*\))'
+
+    r')',
+    re.IGNORECASE
+)
+_STRING_KINDS = ('jsx', 'attr', 'call')
+
+# Texts that only look like an arrow function
+_ARROW_RE = re.compile(r'\s*\(?[\w\s,]*\)?\s*=>.*')
+# Texts that are just numbers or special characters
+_NUMSPECIAL_RE = re.compile(r'[\d\s\.,:;!?\-]+')
+# JSX expression: t("some text") — already internationalized
+_T_CALL_RE = re.compile(r't\(\s*["\']([^"\']+)["\']\s*\)')
+
+# Texts that look like code
+_CODE_LIKE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'^\{.*\}$',          # {...}
+    r'^\$\{.*\}$',        # ${...}
+    r'^\(.*\)$',          # (...)
+    r'^`.*`$',          # `...`
+    r'^(const|let|var|function)\b' # starts with JS declarations
+)]
+
+_NON_KEY_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+_BRACE_RE = re.compile(r'[{}]')
+
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_text(file_path: Path, size: int) -> str:
+    """Read a UTF-8 source file of the given size, memory-mapping large files"""
+    if size < _MMAP_MIN_SIZE:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        content = str(mapped, 'utf-8')
+    # Same newlines as a text-mode read, so spans match
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# Both are pure, and the same UI texts recur across files
+@functools.lru_cache(maxsize=50000)
+def _should_translate(text: str) -> bool:
+    """Determine if a string should be translated"""
+    # Skip empty or very short strings
+    if not text or len(text) < 2:
+        return False
+
+    # Skip if it looks like code
+    if '=>' in text:
+        # If it *only* looks like an arrow function, skip
+        if _ARROW_RE.fullmatch(text):
+            return 'False'
+
+
+    # Skip if it's just numbers or special characters
+    if _NUMSPECIAL_RE.fullmatch(text):
+        return False
+
+
+    # JSX expression: t("some text") — already internationalized
+    # but might be used for checking duplicates or migration
+    if _T_CALL_RE.fullmatch(text):
+            return False   
+
+    for pattern in _CODE_LIKE_PATTERNS:
+        if pattern.match(text):
+            return 'Maybe'
+
+
+    code_indicators = ['{', '}', '(', ')', '=>', 'function', 'const', 'let', 'var', '$', '`']
+    if any(indicator in text for indicator in code_indicators):
+        return 'Maybe'
+
+    return True
+
+
+@functools.lru_cache(maxsize=50000)
+def _generate_translation_key(text: str, context: str = '') -> str:
+    """Generate a unique translation key"""
+    # Create a base key from the text
+    base_key = _NON_KEY_CHARS_RE.sub('', text)
+    base_key = '_'.join(base_key.lower().split()[:5])
+
+    # Add context if needed to ensure uniqueness
+    if not base_key:
+        base_key = 'text'
+
+    # Make it unique with a short hash if needed
+    full_text = f"{text}_{context}"
+    text_hash = hashlib.md5(full_text.encode()).hexdigest()[:6]
+
+    return f"{base_key}_{text_hash}"
+
+
+def _find_strings(content: str, file_name: str) -> List[Tuple[str, str, str, Tuple[int, int]]]:
+    """Find hardcoded strings in file content, as (key, text, process_ind, span) in discovery order"""
+    # Matches of each kind don't overlap each other, as with a separate
+    # finditer per kind; kinds are recorded in pattern order
+    found = {kind: [] for kind in _STRING_KINDS}
+    kind_end = dict.fromkeys(_STRING_KINDS, 0)
+    for match in _STRING_RE.finditer(content):
+        kind = match.lastgroup
+        if match.start() < kind_end[kind]:
+            continue
+        kind_end[kind] = match.end(kind)
+        found[kind].append(match)
+    
+    strings = []
+    for kind in _STRING_KINDS:
+        for match in found[kind]:
+            # Clean up the match
+            text = match.group(kind + '_text').strip()
+            match_span = match.span(kind + '_text')
+
+            # Skip if it's likely code or a variable
+            process_ind = _should_translate(text)
+            if process_ind:
+                # Generate a unique key
+                key = _generate_translation_key(text, file_name)
+                strings.append((key, text, 'Maybe' if process_ind == 'Maybe' else 'True', match_span))
+    return strings
+
+
+def _extract_strings(file_path: Path) -> Tuple[Tuple[int, int], str, List[Tuple[str, str, str, Tuple[int, int]]]]:
+    """
+    Worker process entry point: read a file and find its hardcoded strings.
+    Returns the file's (mtime, size) and content too, for the parent's content cache.
+    """
+    stat = os.stat(file_path)
+    content = _read_text(file_path, stat.st_size)
+    return (stat.st_mtime_ns, stat.st_size), content, _find_strings(content, str(file_path))
+
+
+def _write_json(path, data):
+    """Write data to a file as indented UTF-8 JSON"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
 class I18nAgent:
+    # Pattern to match React components (functions that likely return JSX)
+    # This looks for functions that contain JSX return statements
+    _COMPONENT_PATTERNS = [re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+        # Function components with explicit return containing JSX
+        r'(?:export\s+(?:default\s+)?)?function\s+([A-Z][a-zA-Z0-9]*)\s*\([^)]*\)\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
+        # Arrow function components (const Component = () => { ... return JSX })
+        r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
+        # Arrow function components with implicit return (const Component = () => <JSX>)
+        r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*(?:\(?\s*<)',
+    )]
+
+    # Check if this looks like a React component by looking for JSX patterns
+    _JSX_PATTERNS = [re.compile(pattern) for pattern in (
+        r'return\s*\(',  # return (
+        r'return\s*<',   # return <
+        r'<[A-Z][a-zA-Z0-9]*',  # JSX component tags
+        r'<[a-z]+',      # HTML tags
+        r'className=',   # React className prop
+        r'onClick=',     # React event handlers
+    )]
+
+    # Files picked up by scan_js_files (tuples, for str.endswith)
+    _JS_EXTENSIONS = ('.jsx', '.js', '.tsx', '.ts')
+    _NEXTJS_SPECIAL_FILES = ('_app.jsx', '_app.js', '_document.jsx', '_document.js', '_error.jsx', '_error.js')
+    _EXCLUDE_DIRS = frozenset({'node_modules', '.next', 'build', 'dist'})
+
+    # Added to files and components by refactor_component
+    _IMPORT_STATEMENT = "import { useTranslation } from 'react-i18next';\n"
+    _HOOK_LINE = '\n  const { t } = useTranslation();\n'
+
+    # Texts sent to the LLM in one translation request
+    _TRANSLATION_BATCH_SIZE = 20
+    # Translation requests sent to the LLM at the same time
+    _MAX_CONCURRENT_REQUESTS = 8
+
+    # Number of file contents kept by _read
+    _CONTENT_CACHE_SIZE = 256
+
     def __init__(self, config: Config):
         self.config = config
         self.client = OpenAI(api_key=config.openai_api_key)
@@ -31,6 +243,8 @@ class I18nAgent:
         self.all_files = []
         self.react_files = []
         self.symbols_dict = {}
+        self._translation_cache = None  # sqlite3 connection, open while generating translations
+        self._content_cache = OrderedDict()  # file path -> ((mtime, size), content), least recently used first
     
     def extract_translatable_strings(self):
         # Step 1: Scan project structure
@@ -45,8 +259,16 @@ class I18nAgent:
         
         # Step 2: Extract translatable strings
         print("\n🔍 Extracting translatable strings...")
-        for file_path in react_files:
-            self.extract_strings_from_file(file_path)
+        if len(react_files) > 1:
+            # Scan files in worker processes, merging results in file order
+            with ProcessPoolExecutor() as executor:
+                for file_path, (stamp, content, strings) in zip(react_files, executor.map(_extract_strings, react_files, chunksize=16)):
+                    # Keep the content, so refactor_component doesn't read the file again
+                    self._cache_content(file_path, stamp, content)
+                    self._add_translation_keys(str(file_path), strings)
+        else:
+            for file_path in react_files:
+                self.extract_strings_from_file(file_path)
         print(f"Extracted {len(self.translation_keys)} unique strings")
         
         self.translation_keys_all = self.translation_keys.copy()
@@ -80,10 +302,9 @@ class I18nAgent:
     def create_parse_react_project(self):
         # Save to file
         #if not os.path.exists(self.config.symbols_dict_path):
-        symbols_dict = parse_react_project(self.all_files [:]) ########## TODO: change to all
+        symbols_dict = parse_react_project(self.all_files [:], self.config.symbols_cache_path) ########## TODO: change to all
 
-        with open(self.config.symbols_dict_path, 'w', encoding='utf-8') as f:
-            json.dump(symbols_dict, f, indent=2, ensure_ascii=False)
+        _write_json(self.config.symbols_dict_path, symbols_dict)
         # else:
         #     with open(self.config.symbols_dict_path, 'r', encoding='utf-8') as f: # todo: CNAGE
         #         symbols_dict = json.load(f)
@@ -116,16 +337,12 @@ class I18nAgent:
     def scan_js_files(self) -> List[Path]:
         """Scan for React component files"""
         react_files = []
-        extensions = ['.jsx', '.js', '.tsx', '.ts']
-        nextjs_special_files = ['_app.jsx', '_app.js', '_document.jsx', '_document.js', '_error.jsx', '_error.js']
-
-        exclude_dirs = {'node_modules', '.next', 'build', 'dist'}
         
         for root, dirs, files in os.walk(self.config.project_path):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
+            dirs[:] = [d for d in dirs if d not in self._EXCLUDE_DIRS]
             
             for file in files:
-                if any(file.endswith(ext) for ext in extensions) and not any(file.endswith(special_file) for special_file in nextjs_special_files):
+                if file.endswith(self._JS_EXTENSIONS) and not file.endswith(self._NEXTJS_SPECIAL_FILES):
                     file_path = Path(root) / file
                     # Check if it's likely a React component
                     # if self.is_react_component(file_path):
@@ -133,115 +350,61 @@ class I18nAgent:
                         
         return react_files
     
+    def _read(self, file_path: Path) -> str:
+        """Read a file, reusing the content from an earlier read if the file is unchanged"""
+        stat = os.stat(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._content_cache.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            self._content_cache.move_to_end(file_path)
+            return cached[1]
+        
+        content = _read_text(file_path, stat.st_size)
+        self._cache_content(file_path, stamp, content)
+        return content
+    
+    def _cache_content(self, file_path: Path, stamp: Tuple[int, int], content: str):
+        """Remember a file's content for _read, evicting the least recently used file"""
+        self._content_cache[file_path] = (stamp, content)
+        self._content_cache.move_to_end(file_path)
+        if len(self._content_cache) > self._CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+    
     def is_react_component(self, file_path: Path) -> bool:
         """Check if file contains React component"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                return 'react' in content.lower() or 'jsx' in content
+            content = self._read(file_path)
+            return 'react' in content.lower() or 'jsx' in content
         except:
             return False
     
     def extract_strings_from_file(self, file_path: Path):
         """Extract hardcoded strings from a React file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Patterns to find hardcoded strings
-        patterns = [
-            # r'<(?:button|a|span|p|h[1-6]|div)[^>]*>\s*([^<>]+?)\s*</(?:button|a|span|p|h[1-6]|div)>',
-
-            # JSX any element with direct innerText (fallback for generic cases)
-            r'>([^<\n][^<]+?)</',
-
-            # String literals in props like title="Save", label="Name"
-            r'(?:title|label|placeholder|alt|value|message|description|error|success|warning|info)\s*=\s*["\']([^"\']+?)["\']',
-
-            # Error messages, notifications (console, alert, notify, etc.)
-            r'(?:alert|notify|console\.(?:log|error|warn))\s*\(\s*["\']([^"\']+?)["\']\s*\)',
-        ]
-
-            
-        for pattern in patterns:
-            matches = [match for match in re.finditer(pattern, content, re.IGNORECASE)]
-            for match in matches:
-                # Clean up the match
-                group_id = len(match.groups())
-                text = match.group(group_id).strip()
-                match_span = match.span(group_id)
-
-                # Skip if it's likely code or a variable
-                process_ind = self.should_translate(text)
-                if process_ind:
-                    # Generate a unique key
-                    key = self.generate_translation_key(text, str(file_path))
-                    self.translation_keys[key] = {
-                        'text': text,
-                        'file': str(file_path),
-                        'process_ind' : 'Maybe' if process_ind == 'Maybe' else 'True',
-                        'span' : match_span,
-                        'occurrences': self.translation_keys.get(key, {}).get('occurrences', 0) + 1
-                    }
+        file_name = str(file_path)
+        self._add_translation_keys(file_name, _find_strings(self._read(file_path), file_name))
+    
+    def _add_translation_keys(self, file_name: str, strings: List[Tuple[str, str, str, Tuple[int, int]]]):
+        """Record strings found by _find_strings in translation_keys"""
+        for key, text, process_ind, match_span in strings:
+            self.translation_keys[key] = {
+                'text': text,
+                'file': file_name,
+                'process_ind' : process_ind,
+                'span' : match_span,
+                'occurrences': self.translation_keys.get(key, {}).get('occurrences', 0) + 1
+            }
     
     def should_translate(self, text: str) -> bool:
         """Determine if a string should be translated"""
-        # Skip empty or very short strings
-        if not text or len(text) < 2:
-            return False
-            
-        # Skip if it looks like code
-        if '=>' in text:
-            # If it *only* looks like an arrow function, skip
-            if re.fullmatch(r'\s*\(?[\w\s,]*\)?\s*=>.*', text):
-                return 'False'
-
-
-        # Skip if it's just numbers or special characters
-        if re.fullmatch(r'[\d\s\.,:;!?\-]+', text):
-            return False
-        
-
-        # JSX expression: t("some text") — already internationalized
-        # but might be used for checking duplicates or migration
-        if re.fullmatch(r't\(\s*["\']([^"\']+)["\']\s*\)', text):
-                return False   
-        
-        code_like_patterns = [
-            r'^\{.*\}$',          # {...}
-            r'^\$\{.*\}$',        # ${...}
-            r'^\(.*\)$',          # (...)
-            r'^`.*`$',          # `...`
-            r'^(const|let|var|function)\b' # starts with JS declarations
-        ]
-        for pattern in code_like_patterns:
-            if re.match(pattern, text):
-                return 'Maybe'
-             
-        
-        code_indicators = ['{', '}', '(', ')', '=>', 'function', 'const', 'let', 'var', '$', '`']
-        if any(indicator in text for indicator in code_indicators):
-            return 'Maybe'
-        
-        return True
+        return _should_translate(text)
     
     def generate_translation_key(self, text: str, context: str = '') -> str:
         """Generate a unique translation key"""
-        # Create a base key from the text
-        base_key = re.sub(r'[^a-zA-Z0-9\s]', '', text)
-        base_key = '_'.join(base_key.lower().split()[:5])
-        
-        # Add context if needed to ensure uniqueness
-        if not base_key:
-            base_key = 'text'
-            
-        # Make it unique with a short hash if needed
-        full_text = f"{text}_{context}"
-        text_hash = hashlib.md5(full_text.encode()).hexdigest()[:6]
-        
-        return f"{base_key}_{text_hash}"
+        return _generate_translation_key(text, context)
     
     def generate_translations(self):
         """Use LLM to generate translations"""
+        llm_languages = []
         for lang in self.config.target_languages:
             if lang == self.config.default_language:
                 # For default language, use original text
@@ -249,61 +412,144 @@ class I18nAgent:
                     self.translations[lang][key] = data['text']
             else:
                 # Use LLM for other languages
-                self.generate_language_translations(lang)
-    
-    def generate_language_translations(self, target_lang: str):
-        """Generate translations for a specific language using LLM"""
-        # Batch process translations for efficiency
-        batch_size = 20
-        keys = list(self.translation_keys.keys())[:batch_size] #TODO: batch_size
-        
-        for i in range(0, len(keys), batch_size):
-            batch_keys = keys[i:i + batch_size]
-            texts_to_translate = {
-                key: self.translation_keys[key]['text'] 
-                for key in batch_keys
-            }
-            
-            prompt = f"""
-            Translate the following UI texts from English to {target_lang}.
-            Maintain the tone and context appropriate for a web application.
-            Return a JSON object with the same keys.
+                llm_languages.append(lang)
+        
+        if llm_languages:
+            keys = list(self.translation_keys.keys())[:self._TRANSLATION_BATCH_SIZE] #TODO: batch_size
             
-            Texts to translate:
-            {json.dumps(texts_to_translate, indent=2)}
-            """
+            # The same text often appears under several keys (one per file);
+            # send each text once, under the first key that has it
+            text_keys = {}
+            for key in keys:
+                text_keys.setdefault(self.translation_keys[key]['text'], key)
             
+            self._translation_cache = self._open_translation_cache()
             try:
-                response = self.client.chat.completions.create(
-                    model="gpt-3.5-turbo",
+                asyncio.run(self._generate_translations_concurrently(llm_languages, keys, text_keys))
+            finally:
+                if self._translation_cache is not None:
+                    self._translation_cache.close()
+                    self._translation_cache = None
+    
+    def _open_translation_cache(self):
+        """Open the on-disk translation cache, or return None if it is disabled or unusable"""
+        if not self.config.translation_cache_path:
+            return None
+        try:
+            connection = sqlite3.connect(self.config.translation_cache_path)
+            connection.execute('CREATE TABLE IF NOT EXISTS translations (hash TEXT PRIMARY KEY, translation TEXT)')
+            return connection
+        except sqlite3.Error as e:
+            print(f"Warning: Translation cache {self.config.translation_cache_path} unavailable: {e}")
+            return None
+    
+    def _translation_cache_key(self, text: str, target_lang: str) -> str:
+        """Cache key for a text translated into a language"""
+        return hashlib.md5(f"{text}|{target_lang}".encode()).hexdigest()
+    
+    def _get_cached_translation(self, text: str, target_lang: str):
+        """Get a translation from an earlier run, or None"""
+        if self._translation_cache is None:
+            return None
+        row = self._translation_cache.execute(
+            'SELECT translation FROM translations WHERE hash = ?',
+            (self._translation_cache_key(text, target_lang),)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _set_cached_translations(self, target_lang: str, texts: Dict[str, str], translated_texts: Dict[str, str]):
+        """Store the translations returned for a batch of texts"""
+        if self._translation_cache is None:
+            return
+        rows = [
+            (self._translation_cache_key(text, target_lang), translated_texts[key])
+            for key, text in texts.items()
+            if isinstance(translated_texts.get(key), str)
+        ]
+        self._translation_cache.executemany('INSERT OR REPLACE INTO translations VALUES (?, ?)', rows)
+        self._translation_cache.commit()
+    
+    async def _generate_translations_concurrently(self, languages: List[str], keys: List[str], text_keys: Dict[str, str]):
+        """Translate into all languages at once, limiting the requests in flight"""
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+        # The async client's connections belong to this event loop, so it lives only as long as the run
+        async with AsyncOpenAI(api_key=self.config.openai_api_key) as client:
+            await asyncio.gather(*(self.generate_language_translations(client, lang, keys, text_keys, semaphore)
+                                   for lang in languages))
+    
+    async def generate_language_translations(self, client: AsyncOpenAI, target_lang: str, keys: List[str],
+                                             text_keys: Dict[str, str], semaphore: asyncio.Semaphore):
+        """Generate translations for a specific language using LLM"""
+        # Batch process translations for efficiency
+        batch_size = self._TRANSLATION_BATCH_SIZE
+        
+        # Only texts missing from the translation cache go to the LLM
+        translated_texts = {}
+        unique_keys = []
+        for text, key in text_keys.items():
+            cached = self._get_cached_translation(text, target_lang)
+            if cached is None:
+                unique_keys.append(key)
+            else:
+                translated_texts[key] = cached
+        
+        batches = [unique_keys[i:i + batch_size] for i in range(0, len(unique_keys), batch_size)]
+        results = await asyncio.gather(*(self._translate_batch(client, target_lang, batch_keys, semaphore) for batch_keys in batches))
+        
+        for batch_result in results:
+            translated_texts.update(batch_result)
+        
+        # Fan each translation back out to every key sharing the text, in key order
+        for key in keys:
+            translated_key = text_keys[self.translation_keys[key]['text']]
+            if translated_key in translated_texts:
+                self.translations[target_lang][key] = translated_texts[translated_key]
+    
+    async def _translate_batch(self, client: AsyncOpenAI, target_lang: str, batch_keys: List[str], semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        """Translate one batch of keys, falling back to the original text on errors"""
+        texts_to_translate = {
+            key: self.translation_keys[key]['text'] 
+            for key in batch_keys
+        }
+        
+        texts_json = json.dumps(texts_to_translate, ensure_ascii=False)
+        prompt = f"Translate the values to {target_lang}, keep JSON keys identical.\n{texts_json}"
+        
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
                     messages=[
-                        {"role": "system", "content": "You are a professional translator specializing in UI/UX translations."},
+                        {"role": "system", "content": "You translate web app UI texts. Reply with a JSON object."},
                         {"role": "user", "content": prompt}
                     ],
+                    response_format={"type": "json_object"},
+                    # The reply is the same object with translated values; leave room
+                    # for languages that need more tokens than English
+                    max_tokens=2 * len(texts_json) + 64,
                     temperature=0
                 )
-                
-                translated_texts = json.loads(response.choices[0].message.content)
-                self.translations[target_lang].update(translated_texts)
-                
-            except Exception as e:
-                print(f"Error translating batch for {target_lang}: {e}")
-                # Fallback: use original text
-                for key in batch_keys:
-                    self.translations[target_lang][key] = self.translation_keys[key]['text']
+            
+            translated_texts = json.loads(response.choices[0].message.content)
+            self._set_cached_translations(target_lang, texts_to_translate, translated_texts)
+            return translated_texts
+            
+        except Exception as e:
+            print(f"Error translating batch for {target_lang}: {e}")
+            # Fallback: use original text
+            return texts_to_translate
     
     def create_translation_files(self):
         """Create translation JSON files"""
-        locales_dir = Path(self.config.project_path) / 'public' / 'locales'
+        locales_dir = os.path.join(self.config.project_path, 'public', 'locales')
         
         for lang in self.config.target_languages:
-            lang_dir = locales_dir / lang
-            lang_dir.mkdir(parents=True, exist_ok=True)
+            lang_dir = os.path.join(locales_dir, lang)
+            os.makedirs(lang_dir, exist_ok=True)
             
             # Create translation file
-            translation_file = lang_dir / 'common.json'
-            with open(translation_file, 'w', encoding='utf-8') as f:
-                json.dump(self.translations[lang], f, ensure_ascii=False, indent=2)
+            translation_file = os.path.join(lang_dir, 'common.json')
+            _write_json(translation_file, self.translations[lang])
             
             print(f"Created translation file: {translation_file}")
 
@@ -336,7 +582,7 @@ class I18nAgent:
     export default i18n;
     '''
 
-        config_path = Path(self.config.project_path) / 'lib' / 'i18n.js'
+        config_path = os.path.join(self.config.project_path, 'lib', 'i18n.js')
         with open(config_path, 'w') as f:
             f.write(i18n_config)
 
@@ -350,196 +596,72 @@ class I18nAgent:
     }};
     '''
 
-        next_config_path = Path(self.config.project_path) / 'next-i18next.config.js'
+        next_config_path = os.path.join(self.config.project_path, 'next-i18next.config.js')
         with open(next_config_path, 'w') as f:
             f.write(next_i18n_config)
-
-            
-            next_config_path = Path(self.config.project_path) / 'next-i18next.config.js'
-            with open(next_config_path, 'w') as f:
-                f.write(next_i18n_config)
     
     
-    def update_spans_after_insertion(self, file_path, all_translation_dict, insertion_pos, inserted_text_length):
+    def update_spans_after_insertions(self, file_path, all_translation_dict, insertions):
         """
-        Update span locations in all_translation_dict for entries that come after the insertion point
+        Update span locations in all_translation_dict for several insertions into the same file
         
         Args:
             file_path: Path object of the current file
             all_translation_dict: Dictionary containing translation entries
-            insertion_pos: Position where text was inserted
-            inserted_text_length: Length of the inserted text
+            insertions: (position, length) of each inserted text, in the order they were made
+                (each position accounts for the insertions before it)
         """
-        relative_file_path = str(file_path.relative_to(self.config.project_path))
+        # Entries record the file path as it was scanned (see _add_translation_keys)
+        file_name = str(file_path)
         
-        for key in all_translation_dict:
-            entry = all_translation_dict[key]
-            
-            # Check if this entry belongs to the current file
-            if entry.get("file") == relative_file_path:
+        # Find the current file's entries once, rather than once per insertion
+        file_entries = []
+        for entry in all_translation_dict.values():
+            if entry.get("file") == file_name:
                 current_span = entry.get("span")
-                
                 if current_span and isinstance(current_span, tuple) and len(current_span) == 2:
-                    start_pos, end_pos = current_span
-                    
-                    # Only update spans that start after the insertion point
-                    if start_pos >= insertion_pos:
-                        new_start = start_pos + inserted_text_length
-                        new_end = end_pos + inserted_text_length
-                        all_translation_dict[key]["span"] = (new_start, new_end)
+                    file_entries.append(entry)
+        
+        for entry in file_entries:
+            start_pos, end_pos = entry["span"]
+            for insertion_pos, inserted_text_length in insertions:
+                # Only update spans that start after the insertion point
+                if start_pos >= insertion_pos:
+                    start_pos += inserted_text_length
+                    end_pos += inserted_text_length
+            entry["span"] = (start_pos, end_pos)
 
     def process_file_with_span_updates(self, file_path, content, all_translation_dict):
         """
         Process file content and update spans in all_translation_dict accordingly
         """
-        original_length = len(content)
-        modified = False
+        # The import is added at the beginning, in the same pass as the hooks
+        import_statement = '' if 'useTranslation' in content else self._IMPORT_STATEMENT
+        hook_positions = self._find_hook_positions(content)
         
-        if 'useTranslation' not in content:
-            import_statement = "import { useTranslation } from 'react-i18next';\n"
-            insertion_pos = 0  # Import statement is added at the beginning
-            inserted_length = len(import_statement)
-            
-            content = import_statement + content[:]
-            modified = True
-            
-            # Update spans for this insertion
-            self.update_spans_after_insertion(file_path, all_translation_dict, insertion_pos, inserted_length)
-            
-            # Process hooks addition
-            content, modified_hook = self.add_translation_hooks_with_span_updates(content, file_path, all_translation_dict, inserted_length)
-            modified = bool(modified or modified_hook)
-        else:
-            # If import already exists, just add hooks
-            content, modified_hook = self.add_translation_hooks_with_span_updates(content, file_path, all_translation_dict, 0)
-            modified = bool(modified_hook)
+        content = self._insert_hooks(content, hook_positions, import_statement)
+        self._update_spans_for_hooks(file_path, all_translation_dict, hook_positions, len(import_statement))
         
-        return content, modified
+        return content, bool(import_statement or hook_positions)
 
-    def add_translation_hooks_with_span_updates(self, content, file_path, all_translation_dict, previous_insertions_length=0):
+    def add_translation_hooks(self, content):
         """
-        Add translation hooks and update spans accordingly
+        Original method for backward compatibility - use process_file_with_span_updates when possible
         """
-        modified = False
-        total_inserted_length = previous_insertions_length
-        
-        # Pattern to match React components (functions that likely return JSX)
-        # This looks for functions that contain JSX return statements
-        component_patterns = [
-            # Function components with explicit return containing JSX
-            r'(?:export\s+(?:default\s+)?)?function\s+([A-Z][a-zA-Z0-9]*)\s*\([^)]*\)\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
-            # Arrow function components (const Component = () => { ... return JSX })
-            r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
-            # Arrow function components with implicit return (const Component = () => <JSX>)
-            r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*(?:\(?\s*<)',
-        ]
-        
-        # Keep track of all insertions to update spans correctly
-        insertions = []
-        
-        for pattern in component_patterns:
-            matches = list(re.finditer(pattern, content, re.MULTILINE | re.DOTALL))
-            
-            # Process matches in reverse order to avoid position shifts during insertion
-            for match in reversed(matches):
-                component_name = match.group(1)
-                
-                # Skip if it's clearly not a React component (common HOC patterns)
-                if component_name.lower() in ['withauth', 'withrole', 'withpermission', 'hoc']:
-                    continue
-                    
-                # Check if this function already has useTranslation hook
-                component_start = match.start()
-                
-                # Find the opening brace of the function body
-                if '=>' in match.group(0):
-                    # Arrow function
-                    arrow_pos = content.find('=>', component_start)
-                    if arrow_pos != -1:
-                        # Look for opening brace after arrow
-                        brace_pos = content.find('{', arrow_pos)
-                        if brace_pos != -1:
-                            insert_pos = brace_pos + 1
-                        else:
-                            # Implicit return arrow function, skip
-                            continue
-                    else:
-                        continue
-                else:
-                    # Regular function
-                    brace_pos = content.find('{', match.end() - 1)
-                    if brace_pos != -1:
-                        insert_pos = brace_pos + 1
-                    else:
-                        continue
-                
-                # Find the end of this component to check for existing useTranslation
-                component_end = self.find_function_end(content, insert_pos - 1)
-                component_body = content[insert_pos:component_end]
-                
-                # Skip if useTranslation already exists in this component
-                if 'useTranslation' in component_body:
-                    continue
-                    
-                # Check if this looks like a React component by looking for JSX patterns
-                jsx_patterns = [
-                    r'return\s*\(',  # return (
-                    r'return\s*<',   # return <
-                    r'<[A-Z][a-zA-Z0-9]*',  # JSX component tags
-                    r'<[a-z]+',      # HTML tags
-                    r'className=',   # React className prop
-                    r'onClick=',     # React event handlers
-                ]
-                
-                has_jsx = any(re.search(jsx_pattern, component_body) for jsx_pattern in jsx_patterns)
-                
-                if has_jsx:
-                    # Add the useTranslation hook
-                    hook_line = '\n  const { t } = useTranslation();\n'
-                    hook_length = len(hook_line)
-                    
-                    # Store insertion info for later span updates
-                    insertions.append({
-                        'position': insert_pos,
-                        'length': hook_length
-                    })
-                    
-                    content = content[:insert_pos] + hook_line + content[insert_pos:]
-                    modified = True
-        
-        # Update spans for all insertions made in this function
-        # Process insertions in forward order since we stored them in reverse processing order
-        insertions.reverse()
-        
-        cumulative_offset = total_inserted_length
-        for insertion in insertions:
-            actual_insertion_pos = insertion['position'] + cumulative_offset
-            self.update_spans_after_insertion(file_path, all_translation_dict, actual_insertion_pos, insertion['length'])
-            cumulative_offset += insertion['length']
-        
-        return content, modified
+        hook_positions = self._find_hook_positions(content)
+        return self._insert_hooks(content, hook_positions), bool(hook_positions)
 
-    def add_translation_hooks(self, content):
+    def _find_hook_positions(self, content):
         """
-        Original method for backward compatibility - use the new method with span updates when possible
+        Find where to add the useTranslation hook: right after the opening brace of
+        each component that renders JSX and has no hook yet. Returns sorted positions.
         """
-        modified = False
+        hook_positions = []
         
-        # Pattern to match React components (functions that likely return JSX)
-        # This looks for functions that contain JSX return statements
-        component_patterns = [
-            # Function components with explicit return containing JSX
-            r'(?:export\s+(?:default\s+)?)?function\s+([A-Z][a-zA-Z0-9]*)\s*\([^)]*\)\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
-            # Arrow function components (const Component = () => { ... return JSX })
-            r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*\{(?=(?:[^{}]|{[^}]*})*return\s*(?:\(|\<))',
-            # Arrow function components with implicit return (const Component = () => <JSX>)
-            r'(?:export\s+(?:default\s+)?)?const\s+([A-Z][a-zA-Z0-9]*)\s*=\s*(?:\([^)]*\)|[^=]+)\s*=>\s*(?:\(?\s*<)',
-        ]
-        
-        for pattern in component_patterns:
-            matches = list(re.finditer(pattern, content, re.MULTILINE | re.DOTALL))
+        for pattern in self._COMPONENT_PATTERNS:
+            matches = list(pattern.finditer(content))
             
-            # Process matches in reverse order to avoid position shifts
+            # Process matches in reverse order, so inner components get the hook before enclosing ones
             for match in reversed(matches):
                 component_name = match.group(1)
                 
@@ -576,52 +698,63 @@ class I18nAgent:
                 component_end = self.find_function_end(content, insert_pos - 1)
                 component_body = content[insert_pos:component_end]
                 
-                # Skip if useTranslation already exists in this component
+                # Skip if useTranslation already exists in this component, or a hook is
+                # already going in (this component, or one nested in it)
                 if 'useTranslation' in component_body:
                     continue
+                if any(insert_pos <= hook_pos < component_end for hook_pos in hook_positions):
+                    continue
                     
                 # Check if this looks like a React component by looking for JSX patterns
-                jsx_patterns = [
-                    r'return\s*\(',  # return (
-                    r'return\s*<',   # return <
-                    r'<[A-Z][a-zA-Z0-9]*',  # JSX component tags
-                    r'<[a-z]+',      # HTML tags
-                    r'className=',   # React className prop
-                    r'onClick=',     # React event handlers
-                ]
-                
-                has_jsx = any(re.search(jsx_pattern, component_body) for jsx_pattern in jsx_patterns)
+                has_jsx = any(jsx_pattern.search(component_body) for jsx_pattern in self._JSX_PATTERNS)
                 
                 if has_jsx:
-                    # Add the useTranslation hook
-                    hook_line = '\n  const { t } = useTranslation();\n'
-                    content = content[:insert_pos] + hook_line + content[insert_pos:]
-                    modified = True
-        
-        return content, modified
+                    hook_positions.append(insert_pos)
+        
+        return sorted(hook_positions)
+
+    def _insert_hooks(self, content, hook_positions, prefix=''):
+        """Build content with prefix prepended and the hook line inserted at each position, in one pass"""
+        parts = [prefix]
+        cursor = 0
+        for hook_pos in hook_positions:
+            parts.append(content[cursor:hook_pos])
+            parts.append(self._HOOK_LINE)
+            cursor = hook_pos
+        parts.append(content[cursor:])
+        return ''.join(parts)
+
+    def _update_spans_for_hooks(self, file_path, all_translation_dict, hook_positions, prefix_length=0):
+        """Update spans for the edits made by _insert_hooks"""
+        insertions = [(0, prefix_length)] if prefix_length else []
+        for i, hook_pos in enumerate(hook_positions):
+            # Positions in the content as edited so far
+            insertions.append((hook_pos + prefix_length + i * len(self._HOOK_LINE), len(self._HOOK_LINE)))
+        if insertions:
+            self.update_spans_after_insertions(file_path, all_translation_dict, insertions)
     #############################################################
     def find_function_end(self, content, start_pos):
         """Find the end position of a function body starting from the opening brace."""
         brace_count = 1
-        pos = start_pos + 1
         
-        while pos < len(content) and brace_count > 0:
-            char = content[pos]
-            if char == '{':
+        # Jump from brace to brace instead of looking at every character
+        for match in _BRACE_RE.finditer(content, start_pos + 1):
+            if match.group() == '{':
                 brace_count += 1
-            elif char == '}':
+            else:
                 brace_count -= 1
-            pos += 1
+                if brace_count == 0:
+                    return match.end()
         
-        return pos
+        return max(len(content), start_pos + 1)
 
     
     def refactor_component(self, file_path: Path):
-        def _convert_dict_to_ordered_list(d, file_path):
+        def _convert_dict_to_ordered_list(d, file_name):
             file_translation_keys = {}
             not_cur_files_dict = {}
             for  key, data in d.items():
-                if data['file'] == str(file_path):
+                if data['file'] == file_name:
                     file_translation_keys[key] = data
                 else:
                     not_cur_files_dict[key] = data
@@ -631,28 +764,35 @@ class I18nAgent:
             return sorted_translation_list, not_cur_files_dict
         
         """Refactor a React component to use i18n"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = self._read(file_path)
         
         modified = False
         
         # sorted_translation_list, _ = _convert_dict_to_ordered_list(self.translation_keys, file_path)
-        sorted_translation_list_all, not_cur_files_dict = _convert_dict_to_ordered_list(self.translation_keys_all, file_path)
+        sorted_translation_list_all, not_cur_files_dict = _convert_dict_to_ordered_list(self.translation_keys_all, str(file_path))
                      
-        # Replace hardcoded strings with t() calls
-        for i,(key, data) in enumerate(sorted_translation_list_all):
-            if data['process_ind'] == 'True':
-                replaced_text = f"{{t('{key}')}}"
-                len_diff = len(replaced_text) - (data['span'][1] - data['span'][0])
-                content = content[:data['span'][0]] + f"{{t('{key}')}}" + content[data['span'][1]:]
-
-                for j in range(i + 1,len(sorted_translation_list_all)):
-                    sorted_translation_list_all[j][1]['span'] = (
-                        sorted_translation_list_all[j][1]['span'][0] + len_diff,
-                        sorted_translation_list_all[j][1]['span'][1] + len_diff
-                    )
+        # Replace hardcoded strings with t() calls, building the new content in one pass.
+        # Each span is shifted by the length change of the replacements before it.
+        parts = []
+        cursor = 0  # End of the last replaced span, in the original content
+        offset = 0
+        for key, data in sorted_translation_list_all:
+            start, end = data['span']
+            data['span'] = (start + offset, end + offset)
+            
+            # Skip strings inside a span that was already replaced
+            if data['process_ind'] != 'True' or start < cursor:
+                continue
             
-                modified = True
+            replaced_text = f"{{t('{key}')}}"
+            parts.append(content[cursor:start])
+            parts.append(replaced_text)
+            cursor = end
+            offset += len(replaced_text) - (end - start)
+            modified = True
+        
+        parts.append(content[cursor:])
+        content = ''.join(parts)
 
         all_translation_dict = not_cur_files_dict.copy()
         for i, (key, data) in enumerate(sorted_translation_list_all):
@@ -667,6 +807,7 @@ class I18nAgent:
         if modified:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            self._content_cache.pop(file_path, None)
             self.processed_files.append(file_path)
             print(f"✓ Refactored: {file_path.relative_to(self.config.project_path)}")
         